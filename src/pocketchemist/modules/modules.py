@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from importlib import import_module, metadata  # metadata in python >= 3.8
 from types import ModuleType
 import typing as t
+import weakref
 
 import click
 
@@ -33,8 +34,26 @@ class Module:
 
     _modules = dict()
 
-    def get_module(self) -> t.Union[ModuleType, None]:
-        """Retrieve the module associated with this object
+    #: Live module instances, keyed by id. Entries are removed automatically
+    #: when a module is garbage collected.
+    _instances = weakref.WeakValueDictionary()
+
+    def __post_init__(self):
+        Module._instances[id(self)] = self
+
+    def __setstate__(self, state):
+        # Unpickled modules skip __init__, so they are registered here
+        self.__dict__.update(state)
+        Module._instances[id(self)] = self
+
+    @staticmethod
+    def _load_module(key: str) -> t.Union[ModuleType, None]:
+        """Load a module by name, caching the result.
+
+        Parameters
+        ----------
+        key
+            The full name of the module to load
 
         Returns
         -------
@@ -42,8 +61,6 @@ class Module:
             The loaded module, if available
             None if the module could not be found
         """
-        key = self.name
-
         if key in Module._modules:
             return Module._modules[key]
 
@@ -56,6 +73,17 @@ class Module:
 
         return Module._modules[key]
 
+    def get_module(self) -> t.Union[ModuleType, None]:
+        """Retrieve the module associated with this object
+
+        Returns
+        -------
+        module
+            The loaded module, if available
+            None if the module could not be found
+        """
+        return self._load_module(self.name)
+
     def get_root_module(self) -> t.Union[ModuleType, None]:
         """Retrieve the root module of package
 
@@ -67,12 +95,7 @@ class Module:
         """
         # Try to get the root module's name
         root_module_name = self.name.split('.')[0]
-
-        # Try loading the module
-        try:
-            return import_module(root_module_name)
-        except ImportError:
-            return None
+        return self._load_module(root_module_name)
 
     def get_callable(self,
                      callable_obj: t.Optional[t.Union[str, t.Callable,
@@ -117,8 +140,8 @@ class Module:
     @classmethod
     def list_instances(cls):
         """List modules managed by this class"""
-        import gc
-        return [obj for obj in gc.get_objects() if isinstance(obj, cls)]
+        return [obj for obj in list(Module._instances.values())
+                if isinstance(obj, cls)]
 
     def print(self,
               space_level: int = space_level,
@@ -5,6 +5,11 @@ Utilities for classes
 
 def all_subclasses(cls):
     """Retrieve all subclasses, sub-subclasses and so on for a class
+
+    The direct subclasses of a class are listed before their own subclasses,
+    and classes reached through more than one parent (multiple inheritance)
+    are only listed once.
+
     Parameters
     ----------
     cls : Type
@@ -22,5 +27,14 @@ def all_subclasses(cls):
     [<class 'disseminate.utils.classes.B'>, \
 <class 'disseminate.utils.classes.C'>]
     """
-    return cls.__subclasses__() + [g for s in cls.__subclasses__()
-                                   for g in all_subclasses(s)]
+    subclasses = []
+    seen = set()
+    stack = [cls]
+    while stack:
+        # List the unseen direct subclasses, then expand the first of these
+        # next
+        children = [c for c in stack.pop().__subclasses__() if c not in seen]
+        seen.update(children)
+        subclasses += children
+        stack += reversed(children)
+    return subclasses
@@ -1,11 +1,14 @@
 """
 Tests for module classes
 """
+import os
 import pickle
 from multiprocessing import Pool
 from dataclasses import dataclass
 
-from pocketchemist.modules import Module
+import pytest
+
+from pocketchemist.modules import Module, TorchModule
 
 
 def dummy_func():
@@ -21,21 +24,33 @@ class DummyWrapper:
         return "dummy_wrapper"
 
 
-def test_module_setup():
-    """Test the Module setup"""
+@pytest.fixture(params=['fresh', 'pickled'])
+def module_factory(request):
+    """A factory for Module objects that are either used directly or first
+    round-tripped through pickle"""
+    def factory(*args):
+        module = Module(*args)
+        if request.param == 'pickled':
+            module = pickle.loads(pickle.dumps(module))
+        return module
+    return factory
+
+
+def test_module_setup(module_factory):
+    """Test the Module setup, with fresh and pickled Module objects"""
 
     # 1. Test with callable string
-    module = Module('calcs', 'pickle', 'loads')
+    module = module_factory('calcs', 'pickle', 'loads')
     assert module.get_module() == pickle
     assert module.get_callable() == pickle.loads
 
     # 2. Test with callable object
-    module = Module('calcs', 'pickle', dummy_func)
+    module = module_factory('calcs', 'pickle', dummy_func)
     assert module.get_module() == pickle
     assert module.get_callable() == dummy_func
 
     # 3. Test with callable class
-    module = Module('calcs', 'pickle', DummyWrapper)
+    module = module_factory('calcs', 'pickle', DummyWrapper)
     assert module.get_module() == pickle
 
     # The class was instantiated
@@ -44,55 +59,57 @@ def test_module_setup():
     assert callable_obj.module == module  # it has a reference to the module
     assert hasattr(callable_obj, '__call__')  # it's callable
 
+    # 4. Test with a submodule
+    module = module_factory('calcs', 'os.path', 'join')
+    assert module.get_module() == os.path
+    assert module.get_root_module() == os
+    assert module.get_callable() == os.path.join
 
-def test_module_pickle():
-    """Test the pickling of Module objects"""
 
-    # 1. Test with callable string
-    module = pickle.loads(pickle.dumps(Module('calcs', 'pickle', 'loads')))
-    assert module.get_module() == pickle
-    assert module.get_callable() == pickle.loads
+@pytest.fixture(scope='module')
+def pool():
+    """A multiprocessing pool, with one worker per job, shared by the tests
+    in this module"""
+    with Pool(processes=4) as pool:
+        yield pool
 
-    # 2. Test with callable object
-    module = pickle.loads(pickle.dumps(Module('calcs', 'pickle', dummy_func)))
-    assert module.get_module() == pickle
-    assert module.get_callable() == dummy_func
 
-    # 3. Test with callable class
-    module = Module('calcs', 'pickle', DummyWrapper)
-    assert module.get_module() == pickle
-
-    # The class was instantiated
-    callable_obj = module.get_callable()
-    assert isinstance(callable_obj, DummyWrapper)
-    assert callable_obj.module == module  # it has a reference to the module
-    assert hasattr(callable_obj, '__call__')  # it's callable
+def check_wrapper(result, module):
+    """Check that a result is a DummyWrapper referencing the module"""
+    return isinstance(result, DummyWrapper) and result.module == module
 
 
-def test_module_multiprocessing_pool():
+@pytest.mark.parametrize('callable_obj, check', [
+    ('loads', lambda result, module: result == pickle.loads),
+    (dummy_func, lambda result, module: result == dummy_func),
+    (DummyWrapper, check_wrapper),
+], ids=['string', 'object', 'class'])
+def test_module_multiprocessing_pool(pool, callable_obj, check):
     """Test the multiprocessing pool behavior of Module objects."""
-    import math
+    module = Module('calcs', 'pickle', callable_obj)
+    results = [pool.apply_async(module.get_callable, ()) for i in range(4)]
+    results = [result.get() for result in results]
 
-    # 1. Test with callable string
-    module = Module('calcs', 'pickle', 'loads')
-    with Pool() as pool:
-        results = [pool.apply_async(module.get_callable, ()) for i in range(4)]
-        assert all(result.get() == pickle.loads for result in results)
+    assert all(check(result, module) for result in results)
 
-    # 2. Test with callable object
-    module = Module('calcs', 'pickle', dummy_func)
-    with Pool() as pool:
-        results = [pool.apply_async(module.get_callable, ()) for i in range(4)]
-        assert all(result.get() == dummy_func for result in results)
 
-    # 3. Test with callable class
-    module = Module('calcs', 'pickle', DummyWrapper)
-    with Pool() as pool:
-        results = [pool.apply_async(module.get_callable, ()) for i in range(4)]
-        results = [result.get() for result in results]
-
-        # Check the results
-        assert all(isinstance(callable_obj, DummyWrapper)
-                   for callable_obj in results)
-        assert all(callable_obj.module == module
-                   for callable_obj in results)  # each references module
+def test_module_list_instances():
+    """Test the listing of Module instances"""
+    module = Module('calcs', 'pickle', 'loads')
+    torch_module = TorchModule('fft', 'torch.fft', 'fft')
+
+    # 1. Test listing from the base class and from a subclass
+    assert module in Module.list_instances()
+    assert torch_module in Module.list_instances()
+    assert module not in TorchModule.list_instances()
+    assert torch_module in TorchModule.list_instances()
+
+    # 2. Test that unpickled modules are listed, for all pickle protocols
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        unpickled = pickle.loads(pickle.dumps(module, protocol=protocol))
+        assert any(obj is unpickled for obj in Module.list_instances())
+
+    # 3. Test that deleted modules are no longer listed
+    count = len(Module.list_instances())
+    del unpickled
+    assert len(Module.list_instances()) == count - 1
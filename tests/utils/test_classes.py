@@ -0,0 +1,31 @@
+"""
+Tests for class utilities
+"""
+from pocketchemist.utils.classes import all_subclasses
+
+
+def test_all_subclasses_order():
+    """Test the ordering of subclasses listed by all_subclasses"""
+    class A: pass
+    class B(A): pass
+    class C(A): pass
+    class D(B): pass
+    class E(C): pass
+    class F(D): pass
+
+    # Direct subclasses are listed before their own subclasses
+    assert all_subclasses(A) == [B, C, D, F, E]
+    assert all_subclasses(B) == [D, F]
+    assert all_subclasses(F) == []
+
+
+def test_all_subclasses_diamond():
+    """Test that subclasses with multiple parents are listed once"""
+    class A: pass
+    class B(A): pass
+    class C(A): pass
+    class D(B, C): pass
+    class E(D): pass
+
+    assert all_subclasses(A) == [B, C, D, E]
+    assert all_subclasses(C) == [D, E]